@@ -64,18 +64,15 @@ class DocumentInteractions(ProteusComponent):
             )
             return
 
-        # Check if the id exists in the project
         proteus_id = ProteusID(id)
 
-        # Raise an error if the id does not exist
-        self._controller.get_element(proteus_id)
-
         log.debug(
             f"Object '{proteus_id}' was double clicked in the document html view, opening edit properties dialog"
         )
 
         # Select the object in the document tree. Make sure the item is in the current document
-        # otherwise ask the user if he want
+        # otherwise ask the user if he want.
+        # select_and_navigate_to_object raises an error if the id does not exist
         self.select_and_navigate_to_object(id, False)
 
         # Create the dialog
@@ -114,10 +111,9 @@ class DocumentInteractions(ProteusComponent):
         # Check if the object is in the current document ----------------------
         def find_object_document(object: Object) -> ProteusID:
             """Helper function to find the document of an object"""
-            if PROTEUS_DOCUMENT in object.classes:
-                return object.id
-            else:
-                return find_object_document(object.parent)
+            while PROTEUS_DOCUMENT not in object.classes:
+                object = object.parent
+            return object.id
 
         current_document = self._state_manager.get_current_document()
         object_document = find_object_document(object)
@@ -382,13 +382,15 @@ class GlossaryHandler(ProteusComponent):
             if len(glossary_items) == 0:
                 return
 
-            # Order the items by length so items that contain other items are processed first
-            glossary_items = sorted(glossary_items, key=len, reverse=True)
-
             # Create the TrieRegEx object
+            # NOTE: No need to sort the items by length, the trie regex uses greedy
+            # optional groups so items that contain other items are matched first
             trie = TRE(*glossary_items)
 
             # Create the pattern
+            # NOTE: re.ASCII must not be used even if every item is ASCII, word
+            # boundaries depend on the text alphabet and accented letters would
+            # be treated as boundaries (e.g. 'lisis' matched inside 'análisis')
             GlossaryHandler.pattern = re.compile(
                 rf"\b(?<!-){trie.regex()}(?!-)\b", re.IGNORECASE
             )
@@ -402,7 +404,7 @@ class GlossaryHandler(ProteusComponent):
     # Method: highlight_glossary_items (static)
     # Description: It highlights the glossary items in the text.
     # Date: 10/01/2024
-    # Version: 0.1
+    # Version: 0.2
     # Author: José María Delgado Sánchez
     # --------------------------------------------------------------------------
     @staticmethod
@@ -420,34 +422,41 @@ class GlossaryHandler(ProteusComponent):
         input_text = text
 
         try:
+            if GlossaryHandler.pattern is None:
+                return text
 
-            def highlight_item(match: re.Match) -> str:
-                # Get the match
-                match_text: str = match.group()
-                match_start: int = match.start()
-
-                # Check if the match is inside a code block
-                code_block_matches = GlossaryHandler.code_block_pattern.finditer(text)
-                for code_block_match in code_block_matches:
-                    code_block_start = code_block_match.start()
-                    code_block_end = code_block_match.end()
+            # Compute code block spans once, matches inside them are not decorated
+            code_block_spans: List[tuple] = [
+                code_block_match.span()
+                for code_block_match in GlossaryHandler.code_block_pattern.finditer(
+                    text
+                )
+            ]
 
-                    # If the match is inside a code block, return the match without decoration
-                    if code_block_start <= match_start <= code_block_end:
-                        return match_text
+            # Build the decorated text from the matches and the text between them
+            # NOTE: finditer + join avoids calling a Python callback per match
+            parts: List[str] = []
+            last_end: int = 0
+            for match in GlossaryHandler.pattern.finditer(text):
+                match_text: str = match.group()
+                match_start, match_end = match.span()
 
-                # Get the item
-                item = match_text.lower()
+                # If the match is inside a code block, keep the match without decoration
+                if any(
+                    code_block_start <= match_start <= code_block_end
+                    for code_block_start, code_block_end in code_block_spans
+                ):
+                    continue
 
                 # Get ids linked to the item
-                item_linked_ids = GlossaryHandler.object_ids_by_item[item]
+                item_linked_ids = GlossaryHandler.object_ids_by_item[match_text.lower()]
                 descriptions: List[str] = [
                     GlossaryHandler.items_descriptions[item_id]
                     for item_id in item_linked_ids
                 ]
 
                 # Create the description and set the item id
-                item_id = list(item_linked_ids)[0]
+                item_id = next(iter(item_linked_ids))
                 description_html = ""
                 for index, description in enumerate(descriptions):
                     # Insert space between descriptions if there are more than one
@@ -457,13 +466,14 @@ class GlossaryHandler(ProteusComponent):
                     if description != "":
                         description_html += f"{description}"
 
-                return f'<a href="#{item_id}" onclick="selectAndNavigate(`{item_id}`, event)" title="{escape(description_html)}">{match_text}</a>'
-
-            if GlossaryHandler.pattern is None:
-                return text
+                parts.append(text[last_end:match_start])
+                parts.append(
+                    f'<a href="#{item_id}" onclick="selectAndNavigate(`{item_id}`, event)" title="{escape(description_html)}">{match_text}</a>'
+                )
+                last_end = match_end
 
-            # Replace the items with the decorated items
-            text = re.sub(GlossaryHandler.pattern, highlight_item, text)
+            parts.append(text[last_end:])
+            text = "".join(parts)
         except Exception as e:
             log.error(
                 f"There was an error while highlighting the glossary items in text {input_text}. Error: {e}"
@@ -110,8 +110,9 @@ class Translator(metaclass=SingletonMeta):
             and self.proteus_i18n_directory is not None
         ), "Language configuration must be set before loading the translations."
 
-        # If the available languages are already loaded, return them
-        if self._available_languages:
+        # If the available languages are already loaded, return them. An empty
+        # list is also a valid (cached) result, so check against None
+        if self._available_languages is not None:
             return self._available_languages
         else:
             # Build the path to the language configuration file
@@ -233,11 +234,16 @@ class Translator(metaclass=SingletonMeta):
 
         # Check if the translations_path is a directory or a file
         if translations_path.is_dir():
-            # Get all the yaml files in the directory
-            translations_yaml_files: List[Path] = list(
-                translations_path.rglob("*.yaml")
-            )
-            translations_yml_files: List[Path] = list(translations_path.rglob("*.yml"))
+            # Get all the yaml files in the directory walking it only once.
+            # .yaml files are loaded before .yml files
+            translations_yaml_files: List[Path] = []
+            translations_yml_files: List[Path] = []
+            for file in translations_path.rglob("*.y*ml"):
+                if file.suffix == ".yaml":
+                    translations_yaml_files.append(file)
+                elif file.suffix == ".yml":
+                    translations_yml_files.append(file)
+
             translations_files: List[Path] = (
                 translations_yaml_files + translations_yml_files
             )
@@ -281,9 +287,11 @@ class Translator(metaclass=SingletonMeta):
     # --------------------------------------------------------------------------
     def set_proteus_i18n_directory(self, i18n_directory: Path) -> None:
         """
-        Set the proteus i18n directory for the application.
+        Set the proteus i18n directory for the application. Invalidates the
+        cached available languages, they depend on this directory.
         """
         self.proteus_i18n_directory = i18n_directory
+        self._available_languages = None
 
     # --------------------------------------------------------------------------
     # Method: load_translations
@@ -66,7 +66,12 @@ class SingletonMeta(type):
         """
         Accessed when the class is called, creates a new instance if it does not
         exist.
+
+        Double-checked locking is used so the lock is only acquired while
+        the instance has not been created yet.
         """
+        if cls in cls._instances:
+            return cls._instances[cls]
 
         with cls._lock:
             if cls not in cls._instances:
@@ -392,7 +392,7 @@ class Object(AbstractObject):
     # Method     : accept_descendant
     # Description: Checks if a child is accepted by a PROTEUS object.
     # Date       : 03/08/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
 
@@ -402,6 +402,10 @@ class Object(AbstractObject):
         :Proteus-any and child must accept the object as parent if second level
         object.
 
+        Conditions are evaluated lazily, stopping at the first match, since
+        this method is called for every archetype each time an object is
+        selected.
+
         :param child: Child Object to be checked.
         """
         # Check if the child is a valid object
@@ -417,30 +421,23 @@ class Object(AbstractObject):
         # Condition 1 - child accepted parents must be PROTEUS_ANY
         # or contain one of the object class
 
-        accepted_parent_common_classes = [
-            c for c in child.acceptedParents if c in self.classes
-        ]
-
-        condition_1 = (
-            PROTEUS_ANY in child.acceptedParents
-            or len(accepted_parent_common_classes) > 0
+        condition_1 = PROTEUS_ANY in child.acceptedParents or any(
+            c in self.classes for c in child.acceptedParents
         )
 
+        # BOTH conditions must be true
+        if not condition_1:
+            return False
+
         # --------------------------------------------------------
         # Condition 2 - self accepted children must be PROTEUS_ANY
         # or contain one of the child class
 
-        accepted_children_common_classes = [
-            c for c in self.acceptedChildren if c in child.classes
-        ]
-
-        condition_2 = (
-            PROTEUS_ANY in self.acceptedChildren
-            or len(accepted_children_common_classes) > 0
+        condition_2 = PROTEUS_ANY in self.acceptedChildren or any(
+            c in child.classes for c in self.acceptedChildren
         )
 
-        # BOTH conditions must be true
-        return condition_1 and condition_2
+        return condition_2
 
     # ----------------------------------------------------------------------
     # Method     : generate_xml
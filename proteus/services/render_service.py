@@ -48,6 +48,9 @@ class RenderService:
     objects.
     """
 
+    # Function namespace is global in lxml, it only has to be configured once
+    _namespace_configured: bool = False
+
     # ----------------------------------------------------------------------
     # Method     : __init__
     # Description: Initialize the RenderService object. Load the XSLT
@@ -86,11 +89,19 @@ class RenderService:
         """
         Configuration setup for the XSLT functions. This allows to use
         custom python functions in the XSLT templates using a known prefix.
+
+        The namespace is a lxml global registry, so it is configured only
+        once regardless of the number of RenderService instances.
         """
+        if RenderService._namespace_configured:
+            return
+
         # Namespace for the XSLT functions
         ns = ET.FunctionNamespace(FUNCTION_NAMESPACE)
         ns.prefix = NAMESPACE_PREFIX
 
+        RenderService._namespace_configured = True
+
     # ----------------------------------------------------------------------
     # Method     : _load_templates
     # Description: Load the XSLT templates from the templates directory.
@@ -199,6 +210,9 @@ class RenderService:
                 error_element = ET.SubElement(result_tree, "error")
                 error_element.text = error.message
 
+        # NOTE: str(result_tree) is not used because it honours the template
+        # xsl:output encoding and injects a Content-Type meta tag whose charset
+        # does not match the returned unicode string.
         html_string = ET.tostring(
             result_tree, encoding="unicode", pretty_print=True, method="html"
         )
@@ -38,53 +38,63 @@ from proteus.model.properties import BOOLEAN_PROPERTY_TAG
 
 import proteus.tests.fixtures as fixtures
 
+# --------------------------------------------------------------------------
+# Fixtures and helpers
+# --------------------------------------------------------------------------
+
+# Expected XML serialization: tag, name, category, value, tag
+# NOTE: Compared as bytes, ET.tostring default output is ASCII
+XML_TEMPLATE = '<%s name="%s" category="%s">%s</%s>'
+
+BOOLEAN_VALUES = [
+    ('false', False, 'false'),
+    ('true', True, 'true'),
+    ('True', True, 'true'),
+    ('False', False, 'false'),
+    (str(), False, 'false'),
+    (7.5, False, 'false'),
+    (7, False, 'false'),
+    ('test value', False, 'false')
+]
+
+# Test ids use the raw value so cases sharing the created property are easy to spot
+BOOLEAN_VALUES_IDS = [repr(value) for (value, _, _) in BOOLEAN_VALUES]
+
+@pytest.fixture(scope='module')
+def created(name, category, value, expected_value, expected_xml_value):
+    """
+    It creates a boolean property once per (name, category, value) tuple,
+    shared by the creation and evolution tests (pytest reuses the module
+    scoped instance for every new_value case). It returns the property,
+    the name and the category (set to default values if not given), and
+    the expected value and XML value.
+    """
+    (property, name, category) = fixtures.create_property(BOOLEAN_PROPERTY_TAG, name, category, value)
+    return (property, name, category, expected_value, expected_xml_value)
+
 # --------------------------------------------------------------------------
 # Boolean property tests
 # --------------------------------------------------------------------------
 
-@pytest.mark.parametrize('name',         [str(), 'test name'     ])
-@pytest.mark.parametrize('category',     [str(), 'test category' ])
-@pytest.mark.parametrize('value, expected_value, expected_xml_value',
-    [
-        ('false', False, 'false'),
-        ('true', True, 'true'),
-        ('True', True, 'true'),
-        ('False', False, 'false'),
-        (str(), False, 'false'),
-        (7.5, False, 'false'),
-        (7, False, 'false'),
-        ('test value', False, 'false')
-    ]
-)
-@pytest.mark.parametrize('new_value, expected_new_value, expected_new_xml_value',
-    [   
-        ('false', False, 'false'),
-        ('true', True, 'true'),
-        ('True', True, 'true'),
-        ('False', False, 'false'),
-        (str(), False, 'false'),
-        (7.5, False, 'false'),
-        (7, False, 'false'),
-        ('test value', False, 'false')
-    ]
-)
-
-def test_boolean_properties(name, category, value, expected_value, expected_xml_value, new_value, expected_new_value, expected_new_xml_value):
+@pytest.mark.parametrize('name',         [str(), 'test name'     ], scope='module')
+@pytest.mark.parametrize('category',     [str(), 'test category' ], scope='module')
+@pytest.mark.parametrize('value, expected_value, expected_xml_value', BOOLEAN_VALUES, ids=BOOLEAN_VALUES_IDS, scope='module')
+
+def test_create_and_clone(created):
     """
-    It tests creation, update, and evolution (cloning with a new value) 
-    of boolean properties.
+    It tests creation and update (cloning without changes) of boolean
+    properties.
     """
-    # Create property from XML element
+    (property, name, category, expected_value, expected_xml_value) = created
     property_tag = BOOLEAN_PROPERTY_TAG
-    (property, name, category) = fixtures.create_property(property_tag, name, category, value)
 
     # Check property
     assert(property.name == name)
     assert(property.category == category)    
     assert(property.value == expected_value)
     assert(
-        ET.tostring(property.generate_xml()).decode() ==
-        f'<{property_tag} name="{name}" category="{category}">{expected_xml_value}</{property_tag}>'
+        ET.tostring(property.generate_xml()) ==
+        (XML_TEMPLATE % (property_tag, name, category, expected_xml_value, property_tag)).encode('ascii')
     )
 
     # Clone the property without changes
@@ -95,6 +105,18 @@ def test_boolean_properties(name, category, value, expected_value, expected_xml_
     assert(cloned_property.category == property.category)
     assert(cloned_property.value == property.value)
 
+@pytest.mark.parametrize('name',         [str(), 'test name'     ], scope='module')
+@pytest.mark.parametrize('category',     [str(), 'test category' ], scope='module')
+@pytest.mark.parametrize('value, expected_value, expected_xml_value', BOOLEAN_VALUES, ids=BOOLEAN_VALUES_IDS, scope='module')
+@pytest.mark.parametrize('new_value, expected_new_value, expected_new_xml_value', BOOLEAN_VALUES, ids=BOOLEAN_VALUES_IDS)
+
+def test_evolve(created, new_value, expected_new_value, expected_new_xml_value):
+    """
+    It tests evolution (cloning with a new value) of boolean properties.
+    """
+    (property, name, category, _, _) = created
+    property_tag = BOOLEAN_PROPERTY_TAG
+
     # Clone the property changing value
     evolved_property = property.clone(new_value)
 
@@ -103,6 +125,6 @@ def test_boolean_properties(name, category, value, expected_value, expected_xml_
     assert(evolved_property.category == category)
     assert(evolved_property.value == expected_new_value)    
     assert(
-        ET.tostring(evolved_property.generate_xml()).decode() ==
-        f'<{property_tag} name="{name}" category="{category}">{expected_new_xml_value}</{property_tag}>'
+        ET.tostring(evolved_property.generate_xml()) ==
+        (XML_TEMPLATE % (property_tag, name, category, expected_new_xml_value, property_tag)).encode('ascii')
     )
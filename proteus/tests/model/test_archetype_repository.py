@@ -16,12 +16,13 @@
 # --------------------------------------------------------------------------
 
 import os
-from typing import List
+from typing import Dict, List, Set
 
 # --------------------------------------------------------------------------
 # Third-party library imports
 # --------------------------------------------------------------------------
 
+import pytest
 import lxml.etree as ET
 
 # --------------------------------------------------------------------------
@@ -37,63 +38,130 @@ from proteus.model.project import Project
 # Fixtures and helpers
 # --------------------------------------------------------------------------
 
+class RootChildCounter:
+    """
+    lxml parser target that counts the direct children of the root element
+    without building the element tree.
+    """
+
+    def __init__(self):
+        self.count: int = 0
+        self.depth: int = 0
+
+    def start(self, tag, attrib):
+        self.depth += 1
+
+    def end(self, tag):
+        if self.depth == 2:
+            self.count += 1
+        self.depth -= 1
+
+    def close(self) -> int:
+        return self.count
+
+
+@pytest.fixture(scope="session")
+def archetype_dirs() -> Dict[str, Set[str]]:
+    """
+    Fixture that lists the archetype repository directories once per test
+    session. Tests only read the archetype repository, so the cached
+    listings cannot become stale.
+    """
+    current_archetype_repository = Config().profile_settings.archetypes_directory
+    listings: Dict[str, Set[str]] = {}
+    for archetype_type in ("projects", "documents", "objects"):
+        with os.scandir(current_archetype_repository / archetype_type) as entries:
+            listings[archetype_type] = {entry.name for entry in entries}
+    return listings
+
+
+@pytest.fixture(scope="session")
+def loaded_projects() -> List[Project]:
+    """
+    Fixture that loads the project archetypes once per test session.
+    Archetypes must not be modified by the tests that use it.
+    """
+    return ArchetypeRepository.load_project_archetypes(
+        Config().profile_settings.archetypes_directory
+    )
+
+
+@pytest.fixture(scope="session")
+def loaded_documents() -> List[Object]:
+    """
+    Fixture that loads the document archetypes once per test session.
+    Archetypes must not be modified by the tests that use it.
+    """
+    return ArchetypeRepository.load_document_archetypes(
+        Config().profile_settings.archetypes_directory
+    )
+
+
+@pytest.fixture(scope="session")
+def loaded_objects() -> Dict[str, Dict[str, List[Object]]]:
+    """
+    Fixture that loads the object archetypes once per test session.
+    Archetypes must not be modified by the tests that use it.
+    """
+    return ArchetypeRepository.load_object_archetypes(
+        Config().profile_settings.archetypes_directory
+    )
+
 
 # --------------------------------------------------------------------------
 # ArchetypeRepository unit tests
 # --------------------------------------------------------------------------
 
-def test_project_archetype():
+def test_project_archetype(
+    archetype_dirs: Dict[str, Set[str]], loaded_projects: List[Project]
+):
     # Get the number of projects in archetypes projects
-    current_archetype_repository = Config().profile_settings.archetypes_directory
-    dir_path = str(current_archetype_repository / "projects")
-    number_of_projects : int = len(os.listdir(dir_path))
+    number_of_projects : int = len(archetype_dirs["projects"])
     
     # Check if load project function return all the projects
-    projects : list[Project] = ArchetypeRepository.load_project_archetypes(current_archetype_repository)
+    projects : list[Project] = loaded_projects
     assert len(projects) == number_of_projects, \
         f"Number of archetype projects not match with the number of archetype projects in the directory"
     
     # Check if the projects are Project objects
-    for project in projects:
-        assert isinstance(project, Project), \
-            f"Archetype project {project} is not a Project object"
+    assert all(isinstance(project, Project) for project in projects), \
+        f"Archetype projects {[p for p in projects if not isinstance(p, Project)]} are not Project objects"
 
-def test_document_archetype():
+def test_document_archetype(
+    archetype_dirs: Dict[str, Set[str]], loaded_documents: List[Object]
+):
     # Get the number of documents in archetypes documents
-    current_archetype_repository = Config().profile_settings.archetypes_directory
-    dir_path = str(current_archetype_repository / "documents")
-    number_of_documents = len(os.listdir(dir_path))
+    number_of_documents = len(archetype_dirs["documents"])
     
     # Check if load document function return all the documents
-    documents : list[Object] = ArchetypeRepository.load_document_archetypes(current_archetype_repository)
+    documents : list[Object] = loaded_documents
     assert len(documents) == number_of_documents, \
         f"Number of archetype documents not match with the number of archetype documents in the directory"
     
     # Check if the documents are Object objects
-    for document in documents:
-        assert isinstance(document, Object), \
-            f"Archetype document {document} is not a Object object"
+    assert all(isinstance(document, Object) for document in documents), \
+        f"Archetype documents {[d for d in documents if not isinstance(d, Object)]} are not Object objects"
 
-def test_object_archetype():
+def test_object_archetype(
+    archetype_dirs: Dict[str, Set[str]],
+    loaded_objects: Dict[str, Dict[str, List[Object]]],
+):
     # Get the number of objects arquetypes clases
     current_archetype_repository = Config().profile_settings.archetypes_directory
     dir_path = str(current_archetype_repository / "objects")
-    archetype_groups = os.listdir(dir_path)
+    archetype_groups = archetype_dirs["objects"]
     
     # Check if load object function return all the classes
-    objects : dict[str, dict[str, List[Object]]] = ArchetypeRepository.load_object_archetypes(current_archetype_repository)
+    objects : dict[str, dict[str, List[Object]]] = loaded_objects
     for archetype_group in archetype_groups:
 
         # Check if the class is in the objects dictionary (parsed to remove order prefix)
         assert archetype_group[3:] in objects.keys(), \
             f"Archetype group {archetype_group} not found in objects"
         
-        # Parse the objects.xml file of the class
-        objects_pointer_xml : ET.Element = ET.parse(f"{dir_path}/{archetype_group}/objects.xml")
-
         # Get the number of objects in the objects.xml file ignoring children objects
-        objects_id_list : list[str] = [child.attrib["id"] for child in objects_pointer_xml.getroot()]
-        number_of_objects_expected = len(objects_id_list)
+        parser = ET.XMLParser(target=RootChildCounter())
+        number_of_objects_expected : int = ET.parse(f"{dir_path}/{archetype_group}/objects.xml", parser)
 
         # Check if the number of objects in the class is correct
         objects_list: list[Object] = []
@@ -104,10 +172,9 @@ def test_object_archetype():
             f"Number of objects in group {archetype_group} do not match with the number of objects in the directory"
         
         # Check if the objects are Object objects
-        for object in objects_list:
-            assert isinstance(object, Object), \
-                f"Archetype object {object} is not a Object object"
+        assert all(isinstance(object, Object) for object in objects_list), \
+            f"Archetype objects {[o for o in objects_list if not isinstance(o, Object)]} are not Object objects"
 
-    # Check if the number of classes in the directory is correct
-    assert len(objects.keys()) == len(archetype_groups), \
-        f"Number of object archetype groups not match with the number of groups in the directory"
+    # Check if the classes in the directory match the loaded ones (parsed to remove order prefix)
+    assert objects.keys() == {archetype_group[3:] for archetype_group in archetype_groups}, \
+        f"Object archetype groups not match with the groups in the directory"
@@ -243,6 +243,35 @@ def test_load_children(test_object: Object, request):
         Children in object: {test_object_children_ids}"
 
 
+def test_get_descendants(sample_document: Object):
+    """
+    Test Object get_descendants method returns the direct children of the
+    object in the same order they are stored in the xml file. The children
+    list is the canonical order, views compute item positions from it.
+    """
+    # Get children ids of the xml file in order
+    root: ET.Element = fixtures.get_root(sample_document.path)
+    children_list: list = [
+        child.attrib[ID_ATTRIBUTE] for child in root.find("children")
+    ]
+
+    # Check children are stored in the xml order
+    children_ids = [o.id for o in sample_document.children]
+    assert (
+        children_ids == children_list
+    ), f"Children must be stored in the xml file order.                    \
+        Children in xml file: {children_list}                               \
+        Children in object: {children_ids}"
+
+    # Check descendants are the direct children in the xml order
+    descendants_ids = [o.id for o in sample_document.get_descendants()]
+    assert (
+        descendants_ids == children_list
+    ), f"Descendants must be the direct children in the xml file order.    \
+        Children in xml file: {children_list}                               \
+        Descendants: {descendants_ids}"
+
+
 def test_load_traces(sample_object: Object):
     """
     Test Object load_traces method
@@ -0,0 +1,7 @@
+# ==========================================================================
+# File: __init__.py
+# Description: module initialization for the plugins tests of PROTEUS
+# Date: 15/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
@@ -0,0 +1,94 @@
+# ==========================================================================
+# File: test_glossary_handler.py
+# Description: pytest file for the REMUS plugin glossary handler
+# Date: 15/10/2026
+# Version: 0.1
+# Author: José María Delgado Sánchez
+# ==========================================================================
+
+# --------------------------------------------------------------------------
+# Third party imports
+# --------------------------------------------------------------------------
+
+import pytest
+
+# --------------------------------------------------------------------------
+# Project specific imports
+# --------------------------------------------------------------------------
+
+from proteus.application.configuration.config import Config
+from proteus.application.resources.plugins import Plugins
+from proteus.controller.command_stack import Controller
+from proteus.views.components.abstract_component import ProteusComponent
+
+# --------------------------------------------------------------------------
+# Fixtures
+# --------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def glossary_handler(qapp):
+    """
+    Fixture for the GlossaryHandler component. Plugins are loaded so the
+    plugin module can be imported. Glossary class attributes are restored
+    after the test.
+    """
+    # Load plugins
+    Plugins().load_plugins(Config().profile_settings.plugins_directory)
+
+    from remus.glossary_handler import GlossaryHandler
+
+    # Store previous class attributes
+    prev_descriptions = GlossaryHandler.items_descriptions
+    prev_ids_by_item = GlossaryHandler.object_ids_by_item
+    prev_pattern = GlossaryHandler.pattern
+
+    GlossaryHandler.items_descriptions = dict()
+    GlossaryHandler.object_ids_by_item = dict()
+
+    # Parent component provides the controller to the handler
+    parent = ProteusComponent(controller=Controller())
+    handler = GlossaryHandler(parent)
+
+    yield handler
+
+    # Restore class attributes
+    GlossaryHandler.items_descriptions = prev_descriptions
+    GlossaryHandler.object_ids_by_item = prev_ids_by_item
+    GlossaryHandler.pattern = prev_pattern
+    parent.deleteLater()
+
+
+# --------------------------------------------------------------------------
+# Tests
+# --------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "items, text, expected_matches",
+    [
+        (["lisis", "rea"], "El análisis del área", []),
+        (["analisis"], "El análisis del analisis", ["analisis"]),
+        (["área"], "El Área del área", ["Área", "área"]),
+        (["item"], "item, -item, item1 e ITEM/", ["item", "ITEM"]),
+    ],
+)
+def test_glossary_pattern(glossary_handler, items, text, expected_matches):
+    """
+    Test the glossary regex pattern matches whole items only. Accented
+    letters in the text must not be treated as word boundaries even if
+    every glossary item is ASCII.
+    """
+    # Arrange -------------------------
+    for index, item in enumerate(items):
+        glossary_handler.items_descriptions[f"id{index}"] = f"description {index}"
+        glossary_handler.object_ids_by_item[item] = {f"id{index}"}
+
+    # Act -----------------------------
+    glossary_handler._setup_pattern()
+
+    # Assert --------------------------
+    matches = [match.group() for match in glossary_handler.pattern.finditer(text)]
+    assert (
+        matches == expected_matches
+    ), f"Glossary items found in '{text}' should be {expected_matches}, but found {matches}"
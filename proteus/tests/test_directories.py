@@ -24,10 +24,14 @@ def test_application_directories():
     It tests that essential PROTEUS directories exist.
     """
     app : Config = Config()
-    assert app.app_settings.resources_directory.is_dir()
-    assert app.app_settings.icons_directory.is_dir()
-    assert app.app_settings.i18n_directory.is_dir()
-    assert app.app_settings.profiles_directory.is_dir()
+    directories = (
+        app.app_settings.resources_directory,
+        app.app_settings.icons_directory,
+        app.app_settings.i18n_directory,
+        app.app_settings.profiles_directory,
+        app.profile_settings.archetypes_directory,
+        app.profile_settings.xslt_directory,
+    )
 
-    assert app.profile_settings.archetypes_directory.is_dir()
-    assert app.profile_settings.xslt_directory.is_dir()
+    missing = [directory for directory in directories if not directory.is_dir()]
+    assert not missing, f"PROTEUS directories not found: {missing}"
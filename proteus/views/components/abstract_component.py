@@ -95,24 +95,29 @@ class ProteusComponent(QObject, ABC, metaclass=AbstractObjectMeta):
         super(ProteusComponent, self).__init__(parent, *args, **kwargs)
 
         # Set the QObject name to the class name
-        self.setObjectName(self.__class__.__name__)
+        class_name: str = self.__class__.__name__
+        self.setObjectName(class_name)
+
+        # Avoid building debug messages when debug logging is disabled
+        debug_enabled: bool = log.isEnabledFor(logging.DEBUG)
 
         # Controller --------------
 
         if controller is None:
             # Get parent controller if parent is a ProteusComponent
             if isinstance(parent, ProteusComponent):
-                log.debug(
-                    f"Using parent ProteusComponent {parent.__class__.__name__} Controller for ProteusComponent {self.__class__.__name__}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        f"Using parent ProteusComponent {parent.__class__.__name__} Controller for ProteusComponent {class_name}"
+                    )
                 controller = parent._controller
             else:
                 log.critical(
-                    f"Controller was not provided for ProteusComponent {self.__class__.__name__} and parent is not a ProteusComponent but {parent.__class__.__name__}"
+                    f"Controller was not provided for ProteusComponent {class_name} and parent is not a ProteusComponent but {parent.__class__.__name__}"
                 )
-        else:
+        elif debug_enabled:
             log.debug(
-                f"Custom Controller instance provided for ProteusComponent {self.__class__.__name__}"
+                f"Custom Controller instance provided for ProteusComponent {class_name}"
             )
 
         assert isinstance(
@@ -123,9 +128,9 @@ class ProteusComponent(QObject, ABC, metaclass=AbstractObjectMeta):
         # State manager ----------
         if state_manager is None:
             state_manager = StateManager()
-        else:
+        elif debug_enabled:
             log.debug(
-                f"Custom StateManager instance provided for ProteusComponent {self.__class__.__name__}"
+                f"Custom StateManager instance provided for ProteusComponent {class_name}"
             )
 
         assert isinstance(
@@ -165,21 +170,31 @@ class ProteusComponent(QObject, ABC, metaclass=AbstractObjectMeta):
     # Method     : delete_component
     # Description: Delete the component and all its ProteusComponent children.
     # Date       : 15/11/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def delete_component(self) -> None:
         """
         Delete the component and all its ProteusComponent children.
-        """
-        # Look for ProteusComponent children
-        child: ProteusComponent
-        for child in self.findChildren(ProteusComponent):
-            # Delete the child
-            child.delete_component()
-
-        # Delete the component
-        self.setParent(None)
-        self.deleteLater()
 
-        log.debug(f"Component {self.__class__.__name__} deleted")
+        findChildren is already recursive, so all the ProteusComponent
+        descendants are collected in a single traversal and deleted once,
+        deepest first, instead of letting each child search its own
+        descendants again.
+        """
+        # Look for ProteusComponent descendants (pre-order)
+        components: list[ProteusComponent] = self.findChildren(ProteusComponent)
+        components.reverse()
+        components.append(self)
+
+        # Avoid building debug messages when debug logging is disabled
+        debug_enabled: bool = log.isEnabledFor(logging.DEBUG)
+
+        # Delete the descendants and the component
+        component: ProteusComponent
+        for component in components:
+            component.setParent(None)
+            component.deleteLater()
+
+            if debug_enabled:
+                log.debug(f"Component {component.__class__.__name__} deleted")
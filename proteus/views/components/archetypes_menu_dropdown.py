@@ -90,9 +90,11 @@ class ArchetypesMenuDropdown(QMenu, ProteusComponent):
         Create the component. Using the provided archetype list, create
         a dropdown menu with each archetype as an action.
 
-        Each action is connected to the clone_object method of the controller.
-        The cloned object parent will be the current selected object. By
-        default, every object will use class icon as the action icon.
+        Each action stores its archetype id as data. The menu triggered
+        signal is connected once to the clone_archetype method instead of
+        connecting every action. The cloned object parent will be the current
+        selected object. By default, every object will use class icon as the
+        action icon.
         """
         for archetype in self._archetype_list:
             arch_class = archetype.classes[-1]
@@ -103,18 +105,35 @@ class ArchetypesMenuDropdown(QMenu, ProteusComponent):
             icon: QIcon = Icons().icon(ProteusIconType.Archetype, arch_class)
 
             clone_action.setIcon(icon)
-            clone_action.triggered.connect(
-                lambda checked, arg=archetype.id: self._controller.create_object(
-                    archetype_id=arg, parent_id=self._state_manager.get_current_object()
-                )
-            )
+            clone_action.setData(archetype.id)
             self.addAction(clone_action)
             self.actions[archetype.id] = clone_action
 
+        self.triggered.connect(self.clone_archetype)
+
     # ======================================================================
     # Component slots methods (connected to the component signals and helpers)
     # ======================================================================
 
+    # ----------------------------------------------------------------------
+    # Method     : clone_archetype
+    # Description: Clone the archetype of the triggered action.
+    # Date       : 15/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def clone_archetype(self, action: QAction) -> None:
+        """
+        Clone the archetype whose id is stored in the triggered action data.
+        The cloned object parent will be the current selected object.
+
+        :param action: Triggered action.
+        """
+        self._controller.create_object(
+            archetype_id=action.data(),
+            parent_id=self._state_manager.get_current_object(),
+        )
+
     # ======================================================================
     # Component static methods (create and show the form window)
     # ======================================================================
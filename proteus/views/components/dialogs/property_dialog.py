@@ -172,16 +172,19 @@ class PropertyDialog(ProteusDialog):
         # Properties and traces layout ----------------------------------
 
         # Create a dictionary to hold category widgets
-        category_widgets: Dict[str, QWidget] = self.create_category_widgets(
-            properties_dict
-        )
+        category_widgets: Dict[str, QWidget] = {}
 
         # Iterate over the properties and create widgets for each category
+        # NOTE: Category widgets are created the first time a category is
+        # found, so properties are traversed only once
         prop: Property = None
         for prop in properties_dict.values():
 
-            # Get the category widget
-            category_widget: QWidget = category_widgets[prop.category]
+            # Get the category widget, create it if it doesn't exist
+            category_widget: QWidget = category_widgets.get(prop.category)
+            if category_widget is None:
+                category_widget = self.create_category_widget()
+                category_widgets[prop.category] = category_widget
 
             # Add a row to the category widget with the property input widget and label
             self.add_row_to_category_widget(category_widget, prop)
@@ -222,29 +225,17 @@ class PropertyDialog(ProteusDialog):
     # Helper private methods
     # ======================================================================
 
-    def create_category_widgets(
-        self, properties_dict: Dict[str, Union[Property, Trace]]
-    ) -> Dict[str, QWidget]:
+    def create_category_widget(self) -> QWidget:
         """
-        Create the category widgets tabs for the properties and traces available
-        categories.
+        Create a category widget tab with the form layout where the
+        properties and traces of the category are added.
         """
-        # Create a dictionary to hold category widgets
-        category_widgets: Dict[str, QWidget] = {}
-
-        # Iterate over the properties and create widgets for each category
-        prop: Property | Trace = None
-        for prop in properties_dict.values():
-
-            # Create a QWidget for the category if it doesn't exist
-            if prop.category not in category_widgets:
-                category_widget: QWidget = QWidget()
-                category_layout: QFormLayout = QFormLayout(category_widget)
-                category_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapLongRows)
-                category_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
-                category_widgets[prop.category] = category_widget
+        category_widget: QWidget = QWidget()
+        category_layout: QFormLayout = QFormLayout(category_widget)
+        category_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapLongRows)
+        category_layout.setLabelAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        return category_widgets
+        return category_widget
 
     def add_row_to_category_widget(
             self, category_widget: QWidget, prop: Union[Property, Trace]
@@ -321,9 +312,12 @@ class PropertyDialog(ProteusDialog):
         form_has_errors: bool = False
 
         # Iterate over the input widgets and update the properties dictionary
-        for prop_name in properties_dict.keys():
+        input_widgets: Dict[str, PropertyInput] = self.input_widgets
+        prop_name: str
+        original_prop: Union[Property, Trace]
+        for prop_name, original_prop in properties_dict.items():
             # Get the property input value
-            input_widget: PropertyInput = self.input_widgets[prop_name]
+            input_widget: PropertyInput = input_widgets[prop_name]
 
             # Check if the widget has errors and update the form errors flag
             widget_has_errors: bool = input_widget.has_errors()
@@ -336,8 +330,7 @@ class PropertyDialog(ProteusDialog):
             # Get the value of the property (or trace property)
             new_prop_value: Any = input_widget.get_value()
 
-            # Get the original property and its value
-            original_prop: Union[Property, Trace] = properties_dict[prop_name]
+            # Get the original property value
             if isinstance(original_prop, Trace):
                 original_prop_value: list = original_prop.targets
             else:
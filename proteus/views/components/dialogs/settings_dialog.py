@@ -19,6 +19,7 @@ import logging
 # --------------------------------------------------------------------------
 
 
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QVBoxLayout,
     QLabel,
@@ -166,6 +167,9 @@ class SettingsDialog(ProteusDialog):
         # Language layout
         language_layout: QVBoxLayout = QVBoxLayout()
 
+        # Settings being edited
+        app_settings = Config().app_settings_copy
+
         # Language combo box --------------------------------------
         # Get available languages from translator instance
         languages: List[str] = Translator().available_languages
@@ -175,16 +179,13 @@ class SettingsDialog(ProteusDialog):
 
         for lang in languages:
             self.language_combo.addItem(
+                Icons().icon(ProteusIconType.App, lang),
                 _(f"settings.language.{lang}", alternative_text=lang),
                 lang,
             )
-            self.language_combo.setItemIcon(
-                self.language_combo.count() - 1,
-                Icons().icon(ProteusIconType.App, lang),
-            )
 
         # Set the current language
-        current_lang: str = Config().app_settings_copy.language
+        current_lang: str = app_settings.language
 
         assert (
             current_lang is not None or current_lang == ""
@@ -210,9 +211,7 @@ class SettingsDialog(ProteusDialog):
             )
 
         # Set the current spellcheck language
-        current_spellchecker_lang: str = (
-            Config().app_settings_copy.spellchecker_language
-        )
+        current_spellchecker_lang: str = app_settings.spellchecker_language
 
         # Handle the case when the spellchecker is deactivated
         if current_spellchecker_lang is None or current_spellchecker_lang == "":
@@ -246,29 +245,31 @@ class SettingsDialog(ProteusDialog):
         """
         profile_layout: QVBoxLayout = QVBoxLayout()
 
+        # Settings being edited
+        config = Config()
+        app_settings = config.app_settings_copy
+
         # Profile info --------------------------------------------
-        custom_profile_path: Path = Config().app_settings_copy.custom_profile_path
+        custom_profile_path: Path = app_settings.custom_profile_path
         custom_profile_dir_str: str
         if custom_profile_path is None:
             custom_profile_dir_str = ""
         else:
             custom_profile_dir_str = custom_profile_path.as_posix()
 
-        using_default_profile: bool = Config().app_settings_copy.using_default_profile
+        using_default_profile: bool = app_settings.using_default_profile
 
         # Profiles combo box --------------------------------------
         self.profile_combo: QComboBox = QComboBox()
-        for profile in Config().listed_profiles:
+        for profile in config.listed_profiles:
             self.profile_combo.addItem(
-                _(f"profiles.{profile}", alternative_text=profile), profile
-            )
-            self.profile_combo.setItemIcon(
-                self.profile_combo.count() - 1,
                 Icons().icon(ProteusIconType.Profile, profile),
+                _(f"profiles.{profile}", alternative_text=profile),
+                profile,
             )
 
         self.profile_combo.setCurrentIndex(
-            self.profile_combo.findData(Config().app_settings_copy.selected_profile)
+            self.profile_combo.findData(app_settings.selected_profile)
         )
 
         self.profile_combo.setEnabled(using_default_profile)
@@ -305,12 +306,8 @@ class SettingsDialog(ProteusDialog):
         self.error_profile_label.setHidden(True)
 
         # Connect checkbox signal to the directory edit and combo setEnabled
-        # state = 2 is checked, state = 0 is unchecked
-        self.use_custom_profile_checkbox.stateChanged.connect(
-            lambda state: self.custom_profile_edit.setEnabled(state == 2)
-        )
         self.use_custom_profile_checkbox.stateChanged.connect(
-            lambda state: self.profile_combo.setEnabled(state == 0)
+            self.use_custom_profile_state_changed
         )
 
         # Add the widgets to the layout ---------------------------
@@ -509,7 +506,7 @@ class SettingsDialog(ProteusDialog):
             else None
         )
 
-        config.app_settings_copy = config.app_settings_copy.clone(
+        new_settings = config.app_settings_copy.clone(
             language=self.language_combo.currentData(),
             spellchecker_language=self.spellchecker_combo.currentData(),
             default_view=self.default_view_combo.currentData(),
@@ -522,7 +519,10 @@ class SettingsDialog(ProteusDialog):
         # ---------------------
         # Save settings
         # ---------------------
-        config.app_settings_copy.save()
+        # Avoid rewriting the settings file if nothing changed
+        if new_settings != config.app_settings_copy:
+            config.app_settings_copy = new_settings
+            config.app_settings_copy.save()
 
         # Show warning dialog, the changes will be applied after restart
         # Avoid showing the warning dialog if the settings are the same as the
@@ -537,6 +537,25 @@ class SettingsDialog(ProteusDialog):
         self.close()
         self.deleteLater()
 
+    # ----------------------------------------------------------------------
+    # Method     : use_custom_profile_state_changed
+    # Description: Custom profile checkbox state changed event handler
+    # Date       : 15/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def use_custom_profile_state_changed(self, state: int) -> None:
+        """
+        Manage the custom profile checkbox state changed event. Enables the
+        custom profile directory edit when checked and the profile combo box
+        otherwise.
+
+        :param state: New checkbox state value.
+        """
+        checked: bool = state == Qt.CheckState.Checked.value
+        self.custom_profile_edit.setEnabled(checked)
+        self.profile_combo.setEnabled(not checked)
+
     # ----------------------------------------------------------------------
     # Method     : cancel_button_clicked
     # Description: Cancel button clicked event handler
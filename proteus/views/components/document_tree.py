@@ -12,7 +12,7 @@
 # --------------------------------------------------------------------------
 
 import logging
-from typing import Dict, List
+from typing import Dict, List, Set
 import itertools
 import string
 
@@ -22,6 +22,7 @@ import string
 
 from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtGui import (
+    QBrush,
     QDropEvent,
     QDragEnterEvent,
     QKeyEvent,
@@ -75,14 +76,20 @@ log = logging.getLogger(__name__)  # Logger
 # Global variables and constants
 # --------------------------------------------------------------------------
 
-# Tree item color
+# Tree item color. Stored as brushes so setForeground does not build a new
+# QBrush from the color on every call
 TREE_ITEM_COLOR = {
-    ProteusState.FRESH: Qt.GlobalColor.darkGreen,
-    ProteusState.DIRTY: Qt.GlobalColor.darkYellow,
-    ProteusState.DEAD: Qt.GlobalColor.darkRed,
-    ProteusState.CLEAN: Qt.GlobalColor.black,
+    ProteusState.FRESH: QBrush(Qt.GlobalColor.darkGreen),
+    ProteusState.DIRTY: QBrush(Qt.GlobalColor.darkYellow),
+    ProteusState.DEAD: QBrush(Qt.GlobalColor.darkRed),
+    ProteusState.CLEAN: QBrush(Qt.GlobalColor.black),
 }
 
+# Maximum number of expanded states stored for dead and moved objects. The
+# oldest states are discarded first, those objects will be shown expanded
+# if they are restored
+MAX_DEAD_OBJECTS_EXPANDED_STATE = 5000
+
 
 # --------------------------------------------------------------------------
 # Class: DocumentTree
@@ -136,10 +143,15 @@ class DocumentTree(QTreeWidget, ProteusComponent):
 
         # Dead objects expanded state
         # This allows to restore the expanded state of dead and moved objects
+        # Its size is bounded by MAX_DEAD_OBJECTS_EXPANDED_STATE
         # TODO: Consider to store this as a class variable so objects can
         # be expanded(or not) when moving them across documents.
         self.dead_objects_expanded_state: Dict[ProteusID, bool] = {}
 
+        # Ids of the items that are not displayed as CLEAN. Only these items
+        # need to be updated when the project is saved
+        self.non_clean_items: Set[ProteusID] = set()
+
         # Create the component
         self.create_component()
 
@@ -163,6 +175,11 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         # Set header
         self.header().setVisible(False)
 
+        # Every item is a single line of text with an archetype icon, so
+        # all rows have the same height. This allows Qt to skip the height
+        # calculation for each item when laying out and scrolling the tree
+        self.setUniformRowHeights(True)
+
         # Set drag and drop properties
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
@@ -237,18 +254,21 @@ class DocumentTree(QTreeWidget, ProteusComponent):
     # Method     : _populate_tree
     # Description: Populate document tree given the document structure
     # Date       : 04/06/2023
-    # Version    : 0.2
+    # Version    : 0.3
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def _populate_tree(
         self, parent_item: QTreeWidgetItem, object: Object, position=None
     ):
         """
-        Populate the document tree given an object. This method is recursive.
-        Iterate over the object children and populate the tree with them.
+        Populate the document tree given an object. Iterate over the object
+        descendants (depth-first, using an explicit stack instead of
+        recursion) and populate the tree with them.
 
         :param parent_item: The parent item of the object
         :param object: The object to populate the tree
+        :param position: Position of the object item in the parent item. If
+                         None, the item is added at the end.
         """
         # If object is DEAD do not add it to the tree
         if object.state == ProteusState.DEAD:
@@ -262,15 +282,24 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         else:
             new_item = QTreeWidgetItem(parent_item)
 
-        # Setup the new item with object information
-        self._tree_item_setup(new_item, object)
-
-        # Add the new item to the tree items dictionary
-        self.tree_items[object.id] = new_item
-
-        # Check if the object has children
-        for child in object.children:
-            self._populate_tree(new_item, child)
+        # Pending (item, object) pairs. Children items are created in order
+        # and pushed in reverse order so they are set up in document order
+        tree_items: Dict[ProteusID, QTreeWidgetItem] = self.tree_items
+        stack: List = [(new_item, object)]
+        while stack:
+            item, current_object = stack.pop()
+
+            # Setup the item with object information and add it to the tree
+            # items dictionary
+            self._tree_item_setup(item, current_object)
+            tree_items[current_object.id] = item
+
+            children_items: List = [
+                (QTreeWidgetItem(item), child)
+                for child in current_object.children
+                if child.state != ProteusState.DEAD
+            ]
+            stack.extend(reversed(children_items))
 
     # ----------------------------------------------------------------------
     # Method     : _tree_item_setup
@@ -288,7 +317,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         :param object: The object to match
         """
         # Set the background color based on the object ProteusState
-        tree_item.setForeground(0, TREE_ITEM_COLOR[object.state])
+        self._set_tree_item_color(tree_item, object)
 
         # Set the icon based on the object last class
         object_class: ProteusClassTag = object.classes[-1]
@@ -303,8 +332,9 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         code_str = ""
 
         # Check for PROTEUS_CODE property
-        if object.get_property(PROTEUS_CODE) is not None:
-            code: ProteusCode = object.get_property(PROTEUS_CODE).value
+        code_property = object.get_property(PROTEUS_CODE)
+        if code_property is not None:
+            code: ProteusCode = code_property.value
 
             # If not instance of ProteusCode, cast to string and log warning
             if isinstance(code, ProteusCode):
@@ -334,37 +364,99 @@ class DocumentTree(QTreeWidget, ProteusComponent):
             tree_item.setExpanded(self.dead_objects_expanded_state[object.id])
             self.dead_objects_expanded_state.pop(object.id)
 
+    # ----------------------------------------------------------------------
+    # Method     : _set_tree_item_color
+    # Description: Set the tree item color based on the object state.
+    # Date       : 15/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _set_tree_item_color(self, tree_item: QTreeWidgetItem, object: Object) -> None:
+        """
+        Set the tree item foreground color based on the object ProteusState
+        and keep track of the items that are not displayed as CLEAN.
+
+        :param tree_item: The tree item to update
+        :param object: The object the tree item represents
+        """
+        tree_item.setForeground(0, TREE_ITEM_COLOR[object.state])
+
+        if object.state == ProteusState.CLEAN:
+            self.non_clean_items.discard(object.id)
+        else:
+            self.non_clean_items.add(object.id)
+
     # ----------------------------------------------------------------------
     # Method     : _delete_tree_item
-    # Description: Delete the tree item widget and its children recursively.
+    # Description: Delete the tree item widget and its children.
     # Date       : 20/06/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def _delete_tree_item(self, item: QTreeWidgetItem) -> None:
         """
-        Helper method to delete item widget and its children recursively.
+        Helper method to delete item widget and its children. The expanded
+        state of every item in the subtree is stored and their ids are
+        removed from the tree items dictionary. Then the whole subtree is
+        removed from its parent at once.
         """
-        # Get the children widgets
-        children_widgets: List[QTreeWidgetItem] = [
-            item.child(i) for i in range(item.childCount())
-        ]
+        tree_items: Dict[ProteusID, QTreeWidgetItem] = self.tree_items
+        expanded_state: Dict[ProteusID, bool] = self.dead_objects_expanded_state
+
+        # Traverse the subtree while it is still attached to the tree so
+        # the expanded state can be read
+        pending_items: List[QTreeWidgetItem] = [item]
+        while pending_items:
+            current_item: QTreeWidgetItem = pending_items.pop()
 
-        # Iterate over the children widgets
-        for child_widget in children_widgets:
-            self._delete_tree_item(child_widget)
+            # Item id
+            item_id: ProteusID = current_item.data(1, Qt.ItemDataRole.UserRole)
 
-        # Item id
-        item_id: ProteusID = item.data(1, Qt.ItemDataRole.UserRole)
+            # Save the expanded state of the item
+            expanded_state[item_id] = current_item.isExpanded()
 
-        # Save the expanded state of the item
-        self.dead_objects_expanded_state[item_id] = item.isExpanded()
+            # Remove the item from the tree items dictionary
+            tree_items.pop(item_id)
+            self.non_clean_items.discard(item_id)
+
+            pending_items.extend(
+                current_item.child(i) for i in range(current_item.childCount())
+            )
 
-        # Remove the item from its parent
+        # Discard the oldest stored states if the limit is exceeded
+        while len(expanded_state) > MAX_DEAD_OBJECTS_EXPANDED_STATE:
+            expanded_state.pop(next(iter(expanded_state)))
+
+        # Remove the item (including its children) from its parent
         item.parent().removeChild(item)
 
-        # Remove the item from the tree items dictionary
-        self.tree_items.pop(item_id)
+    # ----------------------------------------------------------------------
+    # Method     : _get_item_position
+    # Description: Get the tree item position of an object among its
+    #              siblings.
+    # Date       : 15/10/2026
+    # Version    : 0.1
+    # Author     : José María Delgado Sánchez
+    # ----------------------------------------------------------------------
+    def _get_item_position(self, object: Object) -> int:
+        """
+        Get the position the tree item of the given object must have among
+        its siblings items. DEAD siblings are omitted since they are not
+        shown in the tree.
+
+        Only the siblings placed before the object are visited.
+
+        :param object: The object to get the item position
+        :return: The position of the object item in its parent item
+        """
+        position: int = 0
+        for sibling in object.parent.children:
+            if sibling is object:
+                break
+            if sibling.state != ProteusState.DEAD:
+                position += 1
+
+        return position
 
     # ======================================================================
     # Component update methods (triggered by PROTEUS application events)
@@ -414,7 +506,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
     # Method     : update_on_save_project
     # Description: Update the document tree when a project is saved.
     # Date       : 06/06/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def update_on_save_project(self) -> None:
@@ -424,9 +516,13 @@ class DocumentTree(QTreeWidget, ProteusComponent):
 
         Triggered by: SaveProjectEvent
         """
-        items = self.tree_items.values()
-        for tree_item in items:
-            tree_item.setForeground(0, Qt.GlobalColor.black)
+        clean_brush: QBrush = TREE_ITEM_COLOR[ProteusState.CLEAN]
+        for item_id in self.non_clean_items:
+            tree_item: QTreeWidgetItem = self.tree_items.get(item_id)
+            if tree_item is not None:
+                tree_item.setForeground(0, clean_brush)
+
+        self.non_clean_items.clear()
 
     # ----------------------------------------------------------------------
     # Method     : update_on_add_object
@@ -471,16 +567,11 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         # NOTE: Parent will always be an Object. Project cannot be selected
         #       as parent to trigger ADD_OBJECT event. When adding an object
         #       with Project as parent ADD_DOCUMENT event is triggered.
-        parent: Object = self._controller.get_element(new_object.parent.id)
-        parent_item.setForeground(0, TREE_ITEM_COLOR[parent.state])
+        parent: Object = new_object.parent
+        self._set_tree_item_color(parent_item, parent)
 
         # Calculate item position relative to its siblings omits DEAD objects
-        siblings: List[Object] = [
-            s
-            for s in new_object.parent.get_descendants()
-            if s.state != ProteusState.DEAD
-        ]
-        position: int = siblings.index(new_object)
+        position: int = self._get_item_position(new_object)
 
         # Create the new item
         self._populate_tree(parent_item, new_object, position=position)
@@ -524,7 +615,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
         #       with Project parent DELETE_DOCUMENT event is triggered.
         parent_id: ProteusID = tree_item.parent().data(1, Qt.ItemDataRole.UserRole)
         parent_object: Object = self._controller.get_element(parent_id)
-        tree_item.parent().setForeground(0, TREE_ITEM_COLOR[parent_object.state])
+        self._set_tree_item_color(tree_item.parent(), parent_object)
 
         # Remove the item from the tree including its children
         self._delete_tree_item(tree_item)
@@ -694,7 +785,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
             parent: Object = self._controller.get_element(
                 parent_item.data(1, Qt.ItemDataRole.UserRole)
             )
-            parent_item.setForeground(0, TREE_ITEM_COLOR[parent.state])
+            self._set_tree_item_color(parent_item, parent)
 
             # Remove the item from the tree
             self._delete_tree_item(self.tree_items[object_id])
@@ -707,16 +798,11 @@ class DocumentTree(QTreeWidget, ProteusComponent):
             # Update the parent item color
             # NOTE: Parent will always be an Object. Project cannot be selected
             #       as parent to trigger CHANGE_OBJECT_POSITION event.
-            parent: Object = self._controller.get_element(object.parent.id)
-            parent_item.setForeground(0, TREE_ITEM_COLOR[parent.state])
+            parent: Object = object.parent
+            self._set_tree_item_color(parent_item, parent)
 
             # Calculate item position relative to its siblings omits DEAD objects
-            siblings: List[Object] = [
-                s
-                for s in object.parent.get_descendants()
-                if s.state != ProteusState.DEAD
-            ]
-            position: int = siblings.index(object)
+            position: int = self._get_item_position(object)
 
             self._populate_tree(parent_item, object, position)
             self._state_manager.set_current_object(object_id, self.document_id)
@@ -736,7 +822,7 @@ class DocumentTree(QTreeWidget, ProteusComponent):
     # Description: Manage the drop event. Move the dropped object to the
     #              target position.
     # Date       : 14/06/2023
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def dropEvent(self, event: QDropEvent):
@@ -753,6 +839,10 @@ class DocumentTree(QTreeWidget, ProteusComponent):
 
         # Get dropped element_id
         dropped_item = source.currentItem()
+        if dropped_item is None:
+            log.warning("Dropped item not found in the source tree.")
+            return
+
         dropped_element_id: ProteusID = dropped_item.data(1, Qt.ItemDataRole.UserRole)
 
         # Drop position
@@ -760,88 +850,80 @@ class DocumentTree(QTreeWidget, ProteusComponent):
 
         # Get target element_id
         target_item = self.itemAt(point)
-        try:
-            target_element_id: ProteusID = target_item.data(1, Qt.ItemDataRole.UserRole)
-        except AttributeError:
+        if target_item is None:
             log.warning(f"Target item not found at position {point}.")
             return
 
-        # Check if dropped item and target item are not None
-        if dropped_item and target_item:
-            # Determine the drop behavior based on the drop position.
-            # If drop position is in the middle of the target item (50% height
-            # centered at the target item), then the dropped item will
-            # be added as a child of the target item. Otherwise, the dropped
-            # item will be added as a sibling of the target item depending on
-            # the drop position (above or below the target item).
-            target_rect = self.visualItemRect(target_item)
-            rect_center = target_rect.center()
-            rect_height = target_rect.height()
-
-            # Get the index of the target item
-            target_index: int = self.indexFromItem(target_item).row()
-
-            # Get the parent id
-            parent_id: ProteusID = None
-            try:
-                parent_id: ProteusID = target_item.parent().data(
-                    1, Qt.ItemDataRole.UserRole
+        target_element_id: ProteusID = target_item.data(1, Qt.ItemDataRole.UserRole)
+
+        # Determine the drop behavior based on the drop position.
+        # If drop position is in the middle of the target item (50% height
+        # centered at the target item), then the dropped item will
+        # be added as a child of the target item. Otherwise, the dropped
+        # item will be added as a sibling of the target item depending on
+        # the drop position (above or below the target item).
+        target_rect = self.visualItemRect(target_item)
+        rect_center_y = target_rect.center().y()
+        rect_quarter_height = target_rect.height() / 4
+        drop_y = event.position().y()
+
+        # Get the index of the target item
+        target_index: int = self.indexFromItem(target_item).row()
+
+        # Get the parent id
+        parent_id: ProteusID = None
+        target_parent_item: QTreeWidgetItem = target_item.parent()
+        if target_parent_item is not None:
+            parent_id = target_parent_item.data(1, Qt.ItemDataRole.UserRole)
+        else:
+            log.debug(
+                f"Failed to get the parent id of the target item '{target_element_id}'. The target item is a root item (PROTEUS document)"
+            )
+
+        try:
+            # Check the dropped item is different from the target item
+            assert (
+                dropped_element_id != target_element_id
+            ), f"Cannot drop element {dropped_element_id} on itself."
+
+            # If in the 25% of the bottom of the target item, then add the
+            # dropped item as a sibling above the target item
+            if drop_y > rect_center_y + rect_quarter_height and parent_id:
+                log.info(
+                    f"Tree element with id {dropped_element_id} dropped below {target_index} insert in {target_index + 1} parent {parent_id}."
+                )
+                self._controller.change_object_position(
+                    dropped_element_id, parent_id, target_index + 1
+                )
+
+            # If in the 25% of the top of the target item, then add the
+            # dropped item as a sibling below the target item
+            elif drop_y < rect_center_y - rect_quarter_height and parent_id:
+                log.info(
+                    f"Tree element with id {dropped_element_id} dropped above {target_index} insert in {target_index} parent {parent_id}."
                 )
-            except AttributeError:
-                log.debug(
-                    f"Failed to get the parent id of the target item '{target_element_id}'. The target item is a root item (PROTEUS document)"
+                self._controller.change_object_position(
+                    dropped_element_id, parent_id, target_index
                 )
 
-            try:
-                # Check the dropped item is different from the target item
-                assert (
-                    dropped_element_id != target_element_id
-                ), f"Cannot drop element {dropped_element_id} on itself."
-
-                # If in the 25% of the bottom of the target item, then add the
-                # dropped item as a sibling above the target item
-                if (
-                    event.position().y() > rect_center.y() + rect_height / 4
-                    and parent_id
-                ):
-                    log.info(
-                        f"Tree element with id {dropped_element_id} dropped below {target_index} insert in {target_index + 1} parent {parent_id}."
-                    )
-                    self._controller.change_object_position(
-                        dropped_element_id, parent_id, target_index + 1
-                    )
-
-                # If in the 25% of the top of the target item, then add the
-                # dropped item as a sibling below the target item
-                elif (
-                    event.position().y() < rect_center.y() - rect_height / 4
-                    and parent_id
-                ):
-                    log.info(
-                        f"Tree element with id {dropped_element_id} dropped above {target_index} insert in {target_index} parent {parent_id}."
-                    )
-                    self._controller.change_object_position(
-                        dropped_element_id, parent_id, target_index
-                    )
-
-                # If in the middle of the target item, then add the dropped item
-                # as a child of the target item. Position as None means that the
-                # dropped item will be added as the last child of the target item.
-                else:
-                    log.info(
-                        f"Tree element with id {dropped_element_id} dropped inside {target_element_id} inserted at the end of the children list."
-                    )
-                    self._controller.change_object_position(
-                        dropped_element_id, target_element_id
-                    )
-            # Catch exception in case the operation is forbidden
-            except AssertionError as e:
-                log.warning(f"{e}")
-
-                MessageBox.warning(
-                    _("document_tree.drop_action.message_box.error.title"),
-                    _("document_tree.drop_action.message_box.error.text"),
+            # If in the middle of the target item, then add the dropped item
+            # as a child of the target item. Position as None means that the
+            # dropped item will be added as the last child of the target item.
+            else:
+                log.info(
+                    f"Tree element with id {dropped_element_id} dropped inside {target_element_id} inserted at the end of the children list."
                 )
+                self._controller.change_object_position(
+                    dropped_element_id, target_element_id
+                )
+        # Catch exception in case the operation is forbidden
+        except AssertionError as e:
+            log.warning(f"{e}")
+
+            MessageBox.warning(
+                _("document_tree.drop_action.message_box.error.title"),
+                _("document_tree.drop_action.message_box.error.text"),
+            )
 
     # ----------------------------------------------------------------------
     # Method     : dragEnterEvent
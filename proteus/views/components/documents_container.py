@@ -103,12 +103,17 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
         document.
         """
         self.setObjectName("documents_container")
-        self.setIconSize(QSize(28, 28))
-        self.tabBar().setExpanding(True)
+        self.setIconSize(QSize(32, 32))
+        tabbar = self.tabBar()
+        tabbar.setExpanding(True)
 
         # Handle tab reordering
         self.setMovable(True)
-        self.tabBar().tabMoved.connect(self.tab_moved)
+        tabbar.tabMoved.connect(self.tab_moved)
+
+        # Drop configuration to allow objects moves between tabs
+        tabbar.setChangeCurrentOnDrag(True)
+        tabbar.setAcceptDrops(True)
 
         # Get project structure from project service
         project_structure: List[Object] = self._controller.get_project_structure()
@@ -155,12 +160,6 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
         # Set the tab icon
         icon = Icons().icon(ProteusIconType.Document, document_acronym)
         self.setTabIcon(tab_index, icon)
-        self.setIconSize(QSize(32, 32))
-
-        # Drop configuration to allow objects moves between tabs
-        tabbar = self.tabBar()
-        tabbar.setChangeCurrentOnDrag(True)
-        tabbar.setAcceptDrops(True)
 
     # ----------------------------------------------------------------------
     # Method     : subscribe
@@ -249,13 +248,13 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
             document_id is not None or document_id != ""
         ), "Document id is None on DELETE OBJECT event"
 
-        # Check there is a tab for the document
+        # Pop the tab from the dictionary and check it existed
+        document_tab: DocumentTree = self.tabs.pop(document_id, None)
         assert (
-            document_id in self.tabs
+            document_tab is not None
         ), f"Document tab not found for document {document_id} on DELETE_DOCUMENT event"
 
         # Delete tab from tabs widget and delete it
-        document_tab: DocumentTree = self.tabs.pop(document_id)
         self.removeTab(self.indexOf(document_tab))
         document_tab.delete_component()
 
@@ -286,20 +285,27 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
             object_id is not None or object_id != ""
         ), "Element id is None on MODIFY OBJECT event"
 
-        # Check if exists a tab for the element
-        if object_id in self.tabs:
-            # Get document tab
-            document_tab: DocumentTree = self.tabs.get(object_id)
-            tab_index: int = self.indexOf(document_tab)
+        # Get document tab, skip if the element is not a document
+        document_tab: DocumentTree = self.tabs.get(object_id)
+        if document_tab is None:
+            return
+
+        tab_index: int = self.indexOf(document_tab)
 
-            # Get new acronym
-            element: Object = self._controller.get_element(object_id)
-            document_acronym: str = element.get_property(PROTEUS_ACRONYM).value
-            self.setTabText(tab_index, document_acronym)
+        # Get new acronym
+        element: Object = self._controller.get_element(object_id)
+        document_acronym: str = element.get_property(PROTEUS_ACRONYM).value
 
-            # Get new icon
-            icon = Icons().icon(ProteusIconType.Document, document_acronym)
-            self.setTabIcon(tab_index, icon)
+        # Skip the tab update if the acronym did not change. Text and icon
+        # depend only on the acronym and each update relayouts the tab bar
+        if self.tabText(tab_index) == document_acronym:
+            return
+
+        self.setTabText(tab_index, document_acronym)
+
+        # Get new icon
+        icon = Icons().icon(ProteusIconType.Document, document_acronym)
+        self.setTabIcon(tab_index, icon)
 
     # ----------------------------------------------------------------------
     # Method     : update_on_current_document_changed
@@ -321,15 +327,16 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
         :param document_id: Id of the current selected document.
         """
 
-        # Check if exists a tab for the element
-        if document_id in self.tabs:
-            # Get document tab
-            document_tab: DocumentTree = self.tabs.get(document_id)
-            tab_index: int = self.indexOf(document_tab)
+        # Get document tab, skip if there is no tab for the element
+        document_tab: DocumentTree = self.tabs.get(document_id)
+        if document_tab is None:
+            return
 
-            if tab_index != self.currentIndex():
-                # Set current tab
-                self.setCurrentIndex(tab_index)
+        tab_index: int = self.indexOf(document_tab)
+
+        if tab_index != self.currentIndex():
+            # Set current tab
+            self.setCurrentIndex(tab_index)
 
     # ======================================================================
     # Component slots methods (connected to the component signals)
@@ -357,11 +364,8 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
             # Access tab from the index
             document_tab: DocumentTree = self.widget(index)
 
-            # Access document id (key) from the tab (value)
-            tab_keys = list(self.tabs.keys())
-            tab_values = list(self.tabs.values())
-            tab_index = tab_values.index(document_tab)
-            document_id: ProteusID = tab_keys[tab_index]
+            # Access document id from the tab document tree
+            document_id = document_tab.document_id
 
         # Avoid updating the state manager if the document is the same
         # This can happen when the tab is selected by current_document_changed
@@ -390,11 +394,7 @@ class DocumentsContainer(QTabWidget, ProteusComponent):
         """
         # Get the document id from the new index (tab has already been moved)
         document_tab: DocumentTree = self.widget(new_index)
-
-        tab_keys = list(self.tabs.keys())
-        tab_values = list(self.tabs.values())
-        tab_index = tab_values.index(document_tab)
-        document_id: ProteusID = tab_keys[tab_index]
+        document_id: ProteusID = document_tab.document_id
 
         log.debug(f"Moving document {document_id} from {old_index} to {new_index}")
 
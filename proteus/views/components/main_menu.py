@@ -169,8 +169,8 @@ class MainMenu(QDockWidget, ProteusComponent):
             self._controller.get_first_level_object_archetypes()
         )
         # Create a tab for each type of object archetypes
-        for type_name in object_archetypes_dict.keys():
-            self.add_archetype_tab(type_name, object_archetypes_dict[type_name])
+        for type_name, object_archetypes_by_class in object_archetypes_dict.items():
+            self.add_archetype_tab(type_name, object_archetypes_by_class)
 
         # --------------------
         # Profile information
@@ -431,7 +431,7 @@ class MainMenu(QDockWidget, ProteusComponent):
         buttons_list: List[ArchetypeMenuButton] = []
 
         # Add the archetype widgets to the tab widget
-        for object_class in object_archetypes_by_class.keys():
+        for object_class, archetype_list in object_archetypes_by_class.items():
             # Create the archetype button
             archetype_button: ArchetypeMenuButton = ArchetypeMenuButton(
                 self, object_class
@@ -444,7 +444,7 @@ class MainMenu(QDockWidget, ProteusComponent):
             archetype_button.setMenu(
                 ArchetypesMenuDropdown(
                     controller=self._controller,
-                    archetype_list=object_archetypes_by_class[object_class],
+                    archetype_list=archetype_list,
                 )
             )
             archetype_button.clicked.connect(archetype_button.showMenu)
@@ -636,9 +636,12 @@ class MainMenu(QDockWidget, ProteusComponent):
         """
         # Triggered by stack changed event to prevent inconsistencies when
         # undo or redo actions are performed
-        self.cut_button.setEnabled(Clipboard().can_cut_and_copy())
-        self.copy_button.setEnabled(Clipboard().can_cut_and_copy())
-        self.paste_button.setEnabled(Clipboard().can_paste())
+        clipboard: Clipboard = Clipboard()
+        can_cut_and_copy: bool = clipboard.can_cut_and_copy()
+
+        self.cut_button.setEnabled(can_cut_and_copy)
+        self.copy_button.setEnabled(can_cut_and_copy)
+        self.paste_button.setEnabled(clipboard.can_paste())
 
     # ----------------------------------------------------------------------
     # Method     : update_on_open_project
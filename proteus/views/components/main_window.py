@@ -161,11 +161,11 @@ class MainWindow(QMainWindow, ProteusComponent):
 
         Triggered by: OpenProjectEvent
         """
-        # Delete the existing widget or container
-        if self.project_container.__class__ == QWidget:
-            self.project_container.setParent(None)
-        elif self.project_container.__class__ == ProjectContainer:
+        # Delete the existing container or placeholder widget
+        if isinstance(self.project_container, ProjectContainer):
             self.project_container.delete_component()
+        else:
+            self.project_container.setParent(None)
 
         # Create document list menu
         self.project_container = ProjectContainer(self)
@@ -205,8 +205,8 @@ class MainWindow(QMainWindow, ProteusComponent):
             return
 
         assert (
-            document_id is not None or document_id != ""
-        ), "Document id is None on SELECT OBJECT event"
+            document_id is not None and document_id != ""
+        ), "Document id is None or empty on SELECT OBJECT event"
 
         # If the selected object is not in the current document, return
         if document_id != self._state_manager.get_current_document():
@@ -216,15 +216,15 @@ class MainWindow(QMainWindow, ProteusComponent):
         selected_object: Object = self._controller.get_element(selected_object_id)
         object_name = selected_object.get_property(PROTEUS_NAME).value
 
-        translated_object_accepted_children = [
+        translated_object_accepted_children: str = ", ".join(
             _(f"archetype.class.{cls}", alternative_text=cls)
             for cls in selected_object.acceptedChildren
-        ]
+        )
 
-        translated_object_accepted_parents = [
+        translated_object_accepted_parents: str = ", ".join(
             _(f"archetype.class.{cls}", alternative_text=cls)
             for cls in selected_object.acceptedParents
-        ]
+        )
 
         # Message to show in the status bar
         message: str = _(
@@ -292,15 +292,20 @@ class MainWindow(QMainWindow, ProteusComponent):
         :param event: Close event
         """
 
+        # Directory of the opened project, None if there is no project opened
+        project: Project = self._controller.get_current_project()
+        project_directory: Path = None
+        if project is not None:
+            project_directory = Path(project.path).parent
+
         def close_without_saving():
             # Clean the command stack
             self._controller.stack.clear()
 
             if not unsaved_changes:
                 # Write the state to a file if there is a project opened
-                if self._controller.get_current_project() is not None:
-                    project_path: str = self._controller.get_current_project().path
-                    write_state_to_file(Path(project_path).parent, self._state_manager)
+                if project_directory is not None:
+                    write_state_to_file(project_directory, self._state_manager)
             # Close the application
             event.accept()
 
@@ -309,8 +314,7 @@ class MainWindow(QMainWindow, ProteusComponent):
             self._controller.save_project()
 
             # Write the state to a file
-            project_path: str = self._controller.get_current_project().path
-            write_state_to_file(Path(project_path).parent, self._state_manager)
+            write_state_to_file(project_directory, self._state_manager)
 
             # Close the application
             event.accept()
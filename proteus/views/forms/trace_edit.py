@@ -11,7 +11,7 @@
 # --------------------------------------------------------------------------
 
 import logging
-from typing import List
+from typing import List, Set
 
 # --------------------------------------------------------------------------
 # Third-party library imports
@@ -57,6 +57,19 @@ from proteus.application.resources.translator import translate as _
 log = logging.getLogger(__name__)  # Logger
 
 
+# --------------------------------------------------------------------------
+# Global variables and constants
+# --------------------------------------------------------------------------
+
+# List widget item data role used by TraceEditDialog to store the object
+# classes, so the items can be filtered without the controller
+CLASSES_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# List widget item data role used by TraceEditDialog to store the lowercased
+# item text, so the name filter does not lowercase it on every keystroke
+NAME_LOWER_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
 # --------------------------------------------------------------------------
 # Class: TraceEdit
 # Description: Trace edit input widget for forms.
@@ -234,8 +247,8 @@ class TraceEdit(QWidget):
                 object, Object
             ), f"Trace must be a reference to an object, id '{trace}' is not a reference to an object but to a '{type(object)}' type."
 
-            # Create QListWidgetItem
-            trace_item: QListWidgetItem = QListWidgetItem(parent=self.list_widget)
+            # Create QListWidgetItem, it is inserted once it is set up
+            trace_item: QListWidgetItem = QListWidgetItem()
             _list_item_setup(trace_item, object)
 
             self.list_widget.addItem(trace_item)
@@ -275,8 +288,8 @@ class TraceEdit(QWidget):
                 object, Object
             ), f"Trace must be a reference to an object, id '{trace}' is not a reference to an object but to a '{type(object)}' type."
 
-            # Create QListWidgetItem
-            trace_item: QListWidgetItem = QListWidgetItem(parent=self.list_widget)
+            # Create QListWidgetItem, it is inserted once it is set up
+            trace_item: QListWidgetItem = QListWidgetItem()
             _list_item_setup(trace_item, object)
 
             # Add item to the QListWidget
@@ -333,8 +346,9 @@ class TraceEdit(QWidget):
         Updates the add button status. Called when a trace is added, removed
         or the traces are set for the first time.
         """
-        traces = self.traces()
-        if self.limit > 0 and len(traces) >= self.limit:
+        # Count the list items directly instead of building the traces list
+        traces_count: int = self.list_widget.count()
+        if self.limit > 0 and traces_count >= self.limit:
             self.add_button.setEnabled(False)
         else:
             self.add_button.setEnabled(True)
@@ -405,6 +419,8 @@ class TraceEditDialog(QDialog):
 
         # Initialize variables
         self.selected_object: ProteusID = None
+        # True while any list widget item is hidden by the filters
+        self._any_hidden: bool = False
 
         # Create component
         self.create_component()
@@ -458,18 +474,27 @@ class TraceEditDialog(QDialog):
             classes=self.accepted_classes
         )
 
+        # Set of already traced objects for constant time membership checks
+        targets_set: Set[ProteusID] = set(self.targets)
+
         # Populate the QListWidget and store found object classes
         classes_set = set()
         object: Object
         for object in objects:
             # Skip objects that are already traced
-            if object.id in self.targets:
+            if object.id in targets_set:
                 continue
 
-            # Create QListWidgetItem
-            object_item: QListWidgetItem = QListWidgetItem(parent=self.list_widget)
+            # Create QListWidgetItem, it is inserted once it is set up
+            object_item: QListWidgetItem = QListWidgetItem()
             _list_item_setup(object_item, object)
 
+            # Store object classes to filter the items without the controller
+            object_item.setData(CLASSES_ROLE, object.classes)
+
+            # Store the lowercased item text to compare with the name filter
+            object_item.setData(NAME_LOWER_ROLE, object_item.text().lower())
+
             # Add item to the QListWidget
             self.list_widget.addItem(object_item)
 
@@ -571,7 +596,7 @@ class TraceEditDialog(QDialog):
     # Method     : update_list_widget
     # Description: Updates the QListWidget items.
     # Date       : 01/02/2024
-    # Version    : 0.1
+    # Version    : 0.2
     # Author     : José María Delgado Sánchez
     # ----------------------------------------------------------------------
     def update_list_widget(self) -> None:
@@ -581,23 +606,38 @@ class TraceEditDialog(QDialog):
         # Unselect the current item
         self.list_widget.setCurrentItem(None)
 
+        # Selected classes in the class filter and the name filter, they do
+        # not change while the items are iterated
+        selected_classes: Set[ProteusClassTag] = set(
+            self.class_selector_combo.checkedItemsData()
+        )
+        name_filter_text = self.name_filter_widget.text().lower()
+
+        # If the filters do not hide any item and every item is already
+        # visible, there is nothing to update
+        if (
+            not name_filter_text
+            and PROTEUS_ANY in selected_classes
+            and not self._any_hidden
+        ):
+            return
+
+        # Items may be left hidden if the loop does not complete, the flag
+        # is only cleared once every item has been checked
+        self._any_hidden = True
+        any_hidden: bool = False
+
         # Iterate over the QListWidget items and hide the ones
         # that do not match the class filter
         for i in range(self.list_widget.count()):
             # Get the item
             item: QListWidgetItem = self.list_widget.item(i)
 
-            # Get the object to compare classes
-            object: Object = self.controller.get_element(
-                element_id=item.data(Qt.ItemDataRole.UserRole)
-            )
+            # Get the object classes stored in the item
+            object_classes: List[ProteusClassTag] = item.data(CLASSES_ROLE)
 
             # Get list widget item text lowercased to compare with the name filter
-            object_name: str = item.text().lower()
-
-            # Selected classes in the class filter and the name filter
-            selected_classes = self.class_selector_combo.checkedItemsData()
-            name_filter_text = self.name_filter_widget.text().lower()
+            object_name: str = item.data(NAME_LOWER_ROLE)
 
             # Check if the object matches the name filter
             if name_filter_text in object_name:
@@ -607,20 +647,22 @@ class TraceEditDialog(QDialog):
                     item.setHidden(False)
                     continue
                 # Condition 2: One of the object classes is selected
-                elif any(
-                    object_class in selected_classes for object_class in object.classes
-                ):
+                elif not selected_classes.isdisjoint(object_classes):
                     item.setHidden(False)
                     continue
                 # Condition 3: None of the conditions above
                 else:
                     item.setHidden(True)
+                    any_hidden = True
                     continue
             # No need to check the class filter if the name filter does not match
             else:
                 item.setHidden(True)
+                any_hidden = True
                 continue
 
+        self._any_hidden = any_hidden
+
     # ----------------------------------------------------------------------
     # Method     : enable_accept_button
     # Description: Enables the accept button.
@@ -734,8 +776,9 @@ def _list_item_setup(list_item: QListWidgetItem, object: Object) -> None:
     code_str = ""
 
     # Check for PROTEUS_CODE property
-    if object.get_property(PROTEUS_CODE) is not None:
-        code: ProteusCode = object.get_property(PROTEUS_CODE).value
+    code_property = object.get_property(PROTEUS_CODE)
+    if code_property is not None:
+        code: ProteusCode = code_property.value
 
         # If not instance of ProteusCode, cast to string and log warning
         if isinstance(code, ProteusCode):